@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import sys
 from typing import Any
 from typing import Awaitable
 from typing import Callable
@@ -15,12 +14,15 @@ from .util.typing import TypeGuard
 
 _T = TypeVar("_T")
 
+_EXIT_EXCEPTION_TYPES = (asyncio.TimeoutError, asyncio.CancelledError)
+
 
 def is_exit_exception(e: BaseException) -> bool:
     # note asyncio.CancelledError is already BaseException
     # so was an exit exception in any case
-    return not isinstance(e, Exception) or isinstance(
-        e, (asyncio.TimeoutError, asyncio.CancelledError)
+    exc_type = type(e)
+    return not issubclass(exc_type, Exception) or issubclass(
+        exc_type, _EXIT_EXCEPTION_TYPES
     )
 
 
@@ -37,10 +39,6 @@ class _AsyncIoGreenlet(greenlet):
 
     __sqlalchemy_greenlet_provider__ = True
 
-    def __init__(self, fn: Callable[..., Any], driver: greenlet):
-        greenlet.__init__(self, fn, driver)
-        self.gr_context = driver.gr_context
-
 
 if TYPE_CHECKING:
     _T_co = TypeVar("_T_co", covariant=True)
@@ -71,7 +69,13 @@ def awaitlet(awaitable: Awaitable[_T]) -> _T:
     """
     # this is called in the context greenlet while running fn
     current = greenlet.getcurrent()
-    if not getattr(current, "__sqlalchemy_greenlet_provider__", False):
+
+    # check for our own greenlet type first; greenlets from other
+    # providers such as SQLAlchemy's greenlet_spawn() are still accepted
+    # via the __sqlalchemy_greenlet_provider__ attribute
+    if type(current) is not _AsyncIoGreenlet and not getattr(
+        current, "__sqlalchemy_greenlet_provider__", False
+    ):
         _safe_cancel_awaitable(awaitable)
 
         raise NoAwaitletContext(
@@ -104,7 +108,10 @@ async def async_def(
     """
 
     result: Any
-    context = _AsyncIoGreenlet(fn, greenlet.getcurrent())
+    driver = greenlet.getcurrent()
+    context = _AsyncIoGreenlet(fn, driver)
+    # run fn within the contextvars context of the calling task
+    context.gr_context = driver.gr_context
     # runs the function synchronously in gl greenlet. If the execution
     # is interrupted by awaitlet, context is not dead and result is a
     # coroutine to wait. If the context is dead the function has
@@ -117,11 +124,11 @@ async def async_def(
             # wait for a coroutine from awaitlet and then return its
             # result back to it.
             value = await result
-        except BaseException:
+        except BaseException as err:
             # this allows an exception to be raised within
             # the moderated greenlet so that it can continue
             # its expected flow.
-            result = context.throw(*sys.exc_info())
+            result = context.throw(type(err), err, err.__traceback__)
         else:
             result = context.switch(value)
 
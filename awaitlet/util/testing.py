@@ -53,12 +53,16 @@ class _Runner:
 
     def get_loop(self) -> asyncio.AbstractEventLoop:
         """Return embedded event loop."""
-        self._lazy_init()
+        if not self._loop:
+            self._lazy_init()
         assert self._loop
         return self._loop
 
     def run(self, coro: Coroutine[Any, Any, _T]) -> _T:
-        self._lazy_init()
+        # _lazy_init() is only needed while the loop is None (not yet
+        # created) or False (closed, which raises)
+        if not self._loop:
+            self._lazy_init()
         assert self._loop
         return self._loop.run_until_complete(coro)
 
@@ -92,7 +96,7 @@ def expect_raises(except_cls, check_context=True):
         success = True
         if check_context and not are_we_already_in_a_traceback:
             _assert_proper_exception_context(err)
-        print(str(err).encode("utf-8"))
+        print(str(err))
 
     # it's generally a good idea to not carry traceback objects outside
     # of the except: block, but in this case especially we seem to have
@@ -115,12 +119,12 @@ def _assert_proper_exception_context(exception):
 
     """
 
+    context = exception.__context__
     if (
-        exception.__context__ is not exception.__cause__
+        context is not exception.__cause__
         and not exception.__suppress_context__
     ):
         assert False, (
             "Exception %r was correctly raised but did not set a cause, "
-            "within context %r as its cause."
-            % (exception, exception.__context__)
+            "within context %r as its cause." % (exception, context)
         )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from functools import partial
+from typing import Dict
 from typing import List
 
 import pytest
@@ -13,10 +13,34 @@ from awaitlet.util import testing
 testing.async_test = async_test = pytest.mark.async_test
 
 
+def _run_async_test(fn):
+    def run_async_test(*args, **kwargs):
+        return testing.run_coroutine_function(fn, *args, **kwargs)
+
+    return run_async_test
+
+
 def pytest_collection_modifyitems(session, config, items: List[Item]):
+    # items share their class / module, so look up the marker on each
+    # parent node only once
+    async_parents: Dict[str, bool] = {}
+
     for item in items:
-        if isinstance(item, Function) and item.get_closest_marker(
-            "async_test"
-        ):
+        if not isinstance(item, Function):
+            continue
+
+        if any(mark.name == "async_test" for mark in item.own_markers):
+            is_async = True
+        else:
+            parent = item.parent
+            assert parent is not None
+            try:
+                is_async = async_parents[parent.nodeid]
+            except KeyError:
+                is_async = async_parents[parent.nodeid] = (
+                    parent.get_closest_marker("async_test") is not None
+                )
+
+        if is_async:
             item.orig_obj = fn = item.obj
-            item.obj = partial(testing.run_coroutine_function, fn)
+            item.obj = _run_async_test(fn)
@@ -1,6 +1,8 @@
 import asyncio
 import contextvars
+import itertools
 import random
+import traceback
 
 from awaitlet import async_def
 from awaitlet import awaitlet
@@ -37,6 +39,19 @@ class TestAsyncioCompat:
         with expect_raises(ValueError):
             await async_def(go, run1, err)
 
+    @async_test
+    async def test_async_error_traceback(self):
+        async def err():
+            raise ValueError("an error")
+
+        with expect_raises(ValueError) as ec:
+            await async_def(go, run1, err)
+
+        # the frame of the awaitable that raised is retained when the
+        # exception is thrown back into the greenlet
+        tb = traceback.extract_tb(ec.error.__traceback__)
+        eq_(tb[-1].name, "err")
+
     @async_test
     async def test_propagate_cancelled(self):
         cleanup = []
@@ -111,13 +126,17 @@ class TestAsyncioCompat:
 
         # NOTE: sleep here is not necessary. It's used to simulate IO
         # ensuring that task are not run sequentially
+        delays = itertools.cycle(
+            [random.uniform(0.005, 0.015) for _ in range(concurrency)]
+        )
+
         async def async_inner(val):
-            await asyncio.sleep(random.uniform(0.005, 0.015))
+            await asyncio.sleep(next(delays))
             eq_(val, var.get())
             return var.get()
 
         async def async_set(val):
-            await asyncio.sleep(random.uniform(0.005, 0.015))
+            await asyncio.sleep(next(delays))
             var.set(val)
 
         def inner(val):
@@ -141,9 +160,9 @@ class TestAsyncioCompat:
             return retval
 
         async def task(val):
-            await asyncio.sleep(random.uniform(0.005, 0.015))
+            await asyncio.sleep(next(delays))
             var.set(val)
-            await asyncio.sleep(random.uniform(0.005, 0.015))
+            await asyncio.sleep(next(delays))
             return await async_def(inner, val)
 
         values = {
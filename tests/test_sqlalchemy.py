@@ -1,8 +1,10 @@
 import pytest
 
 from awaitlet import async_def
+from awaitlet import awaitlet
 from awaitlet.util.testing import async_test
 from awaitlet.util.testing import eq_
+from awaitlet.util.testing import run_coroutine_function
 
 
 try:
@@ -13,18 +15,27 @@ else:
     from sqlalchemy.ext.asyncio import create_async_engine
     from sqlalchemy import select
     from sqlalchemy import literal
+    from sqlalchemy.util import greenlet_spawn
 
 requires_sqlalchemy = pytest.mark.skipif(
     sqlalchemy is None, reason="sqlalchemy not installed"
 )
 
 
+@pytest.fixture(scope="module")
+def async_engine():
+    ae = create_async_engine("sqlite+aiosqlite://")
+    yield ae
+
+    # dispose on the same event loop that runs the async tests
+    run_coroutine_function(ae.dispose)
+
+
 @requires_sqlalchemy
 class TestSQLAlchemyIntegration:
     @async_test
-    async def test_engine_excecute(self):
-        ae = create_async_engine("sqlite+aiosqlite://")
-        e = ae.sync_engine
+    async def test_engine_excecute(self, async_engine):
+        e = async_engine.sync_engine
 
         def do_stuff():
             with e.connect() as conn:
@@ -34,3 +45,14 @@ class TestSQLAlchemyIntegration:
 
         data = await async_def(do_stuff)
         eq_(data, "hello")
+
+    @async_test
+    async def test_awaitlet_in_sqlalchemy_greenlet(self):
+        async def run1():
+            return 1
+
+        def do_stuff():
+            return awaitlet(run1())
+
+        data = await greenlet_spawn(do_stuff)
+        eq_(data, 1)